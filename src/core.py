@@ -7,6 +7,10 @@ import re
 from typing import List
 
 
+# Compiled once at import: normalize() runs on every analysis
+_WS_RE = re.compile(r'\s+')
+
+
 def normalize(text: str) -> str:
     """Normalize text for analysis.
     
@@ -21,9 +25,7 @@ def normalize(text: str) -> str:
     Returns:
         Normalized string
     """
-    text = text.lower()
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    return _WS_RE.sub(' ', text.lower()).strip()
 
 
 def tokenize(text: str) -> List[str]:
@@ -38,10 +40,8 @@ def tokenize(text: str) -> List[str]:
     Returns:
         List of token strings
     """
-    normalized = normalize(text)
-    # Split on whitespace and filter empty
-    tokens = [t for t in normalized.split() if t]
-    return tokens
+    # Bare split() collapses whitespace runs and never yields empty strings
+    return normalize(text).split()
 
 
 def label_from_score(
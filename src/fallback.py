@@ -4,45 +4,99 @@ No ML, no training, no I/O. Pure functions.
 Used when ML model unavailable.
 """
 
-from src.core import normalize, tokenize, label_from_score, clamp_unit
+import math
+import re
+
+from src.core import normalize, label_from_score
 
 
 # Tiny lexicons: core emotional words
-POS_WORDS = {
+POS_WORDS = frozenset({
     "love", "great", "amazing", "excellent", "fantastic",
     "wonderful", "awesome", "happy", "best", "enjoyed",
     "recommend", "perfect", "brilliant", "outstanding",
     "good", "nice", "fine", "super", "beautiful"
-}
+})
 
-NEG_WORDS = {
+NEG_WORDS = frozenset({
     "hate", "terrible", "awful", "horrible", "worst",
     "bad", "disappointed", "garbage", "waste", "broken",
     "frustrated", "upset", "never", "poor", "useless",
     "worst", "disgusting", "pathetic"
-}
+})
 
 # Negators flip sentiment
-NEGATORS = {
+NEGATORS = frozenset({
     "not", "no", "never", "don't", "doesn't", "didn't",
     "won't", "can't", "cannot", "neither", "nor"
-}
+})
 
 # Boosters amplify sentiment
-BOOSTERS = {
+BOOSTERS = frozenset({
     "very", "extremely", "absolutely", "really", "so",
     "highly", "completely", "totally", "utterly"
-}
+})
 
 # Dampeners reduce sentiment
-DAMPENERS = {
+DAMPENERS = frozenset({
     "somewhat", "slightly", "barely", "hardly", "maybe",
     "perhaps", "kind of", "sort of"
-}
+})
 
 # Emoji hints (simple)
-EMOJI_POS = {"😊", "😀", "😃", "❤️", "👍", "🎉", "✨"}
-EMOJI_NEG = {"😡", "😢", "😞", "👎", "💔", "😠"}
+EMOJI_POS = frozenset({"😊", "😀", "😃", "❤️", "👍", "🎉", "✨"})
+EMOJI_NEG = frozenset({"😡", "😢", "😞", "👎", "💔", "😠"})
+
+# One alternation to find every known emoji in a single pass
+_EMOJI_RE = re.compile(
+    "|".join(re.escape(e) for e in sorted(EMOJI_POS | EMOJI_NEG, key=len, reverse=True))
+)
+
+# Token kinds for the merged lexicon; modifiers are bit flags
+_WORD = 0
+_NEGATOR = 1
+_BOOSTER = 2
+_DAMPENER = 4
+
+# Word-score multiplier for each combination of pending modifier flags.
+# Flags are set, not stacked: "not not good" negates once, as before.
+_MODIFIER_FACTORS = tuple(
+    (-1.0 if mask & _NEGATOR else 1.0)
+    * (1.8 if mask & _BOOSTER else 1.0)
+    * (0.5 if mask & _DAMPENER else 1.0)
+    for mask in range(8)
+)
+
+
+def _build_lexicon() -> dict:
+    """Merge all word lexicons into one word -> (kind, score) table.
+    
+    WHY: One dict probe per token instead of up to five set probes.
+    Filled lowest-precedence first so overlaps (e.g. "never") resolve
+    the same way the original if-chain did: negator > booster >
+    dampener > positive > negative.
+    """
+    lexicon = {}
+    for word in NEG_WORDS:
+        lexicon[word] = (_WORD, -0.7)
+    for word in POS_WORDS:
+        lexicon[word] = (_WORD, 0.7)
+    for word in DAMPENERS:
+        lexicon[word] = (_DAMPENER, 0.0)
+    for word in BOOSTERS:
+        lexicon[word] = (_BOOSTER, 0.0)
+    for word in NEGATORS:
+        lexicon[word] = (_NEGATOR, 0.0)
+    return lexicon
+
+
+_LEXICON = _build_lexicon()
+
+# Unknown words still consume pending modifiers, with zero score
+_UNKNOWN = (_WORD, 0.0)
+
+# Edge punctuation stripped from each token before lexicon lookup
+_PUNCT = ".,!?;:\"'"
 
 
 def analyze_fallback_score(text: str) -> float:
@@ -66,75 +120,48 @@ def analyze_fallback_score(text: str) -> float:
         Sentiment score in [-1, 1]
     """
     normalized = normalize(text)
-    tokens = tokenize(normalized)
+    # Already normalized: a bare split() is all tokenize() would add
+    tokens = normalized.split()
     
     score = 0.0
-    negation_active = False
-    booster_active = False
-    dampener_active = False
+    pending = 0  # Modifier flags waiting for the next word
     
-    for i, token in enumerate(tokens):
+    for token in tokens:
         # Strip punctuation for word matching
-        word = token.strip(".,!?;:\"'")
+        kind, word_score = _LEXICON.get(token.strip(_PUNCT), _UNKNOWN)
         
-        # Check negation
-        if word in NEGATORS:
-            negation_active = True
-            continue
-        
-        # Check boosters/dampeners
-        if word in BOOSTERS:
-            booster_active = True
-            continue
-        if word in DAMPENERS:
-            dampener_active = True
+        # Modifiers arm a flag for the next word
+        if kind:
+            pending |= kind
             continue
         
-        # Score word
-        if word in POS_WORDS:
-            word_score = 0.7
-        elif word in NEG_WORDS:
-            word_score = -0.7
-        else:
-            word_score = 0.0
-        
-        # Apply modifiers
-        if negation_active:
-            word_score *= -1.0
-            negation_active = False  # Reset after applying
-        
-        if booster_active:
-            word_score *= 1.8
-            booster_active = False
-        
-        if dampener_active:
-            word_score *= 0.5
-            dampener_active = False
-        
-        score += word_score
+        # Apply and reset modifiers
+        score += word_score * _MODIFIER_FACTORS[pending]
+        pending = 0
     
     # Punctuation emphasis: ! adds +0.1, multiple ? adds confusion (neutral bias)
     exclamation_count = normalized.count("!")
     if exclamation_count > 0:
         score += 0.1 * exclamation_count
     
-    # Check emojis
-    for emoji in EMOJI_POS:
-        if emoji in text:
-            score += 0.3
-    for emoji in EMOJI_NEG:
-        if emoji in text:
-            score -= 0.3
+    # Check emojis: each distinct emoji counts once (presence, not count).
+    # Positives before negatives, as floats don't sum order-independently.
+    emoji_hits = set(_EMOJI_RE.findall(text))
+    for _ in emoji_hits & EMOJI_POS:
+        score += 0.3
+    for _ in emoji_hits & EMOJI_NEG:
+        score -= 0.3
     
     # Normalize by length (avoid long text domination)
     # Use gentler normalization for short texts
-    if len(tokens) > 0:
-        if len(tokens) <= 3:
-            score = score / max(1.0, len(tokens) * 0.6)
+    n = len(tokens)
+    if n > 0:
+        if n <= 3:
+            score = score / max(1.0, n * 0.6)
         else:
-            score = score / (len(tokens) ** 0.5)
+            score = score / math.sqrt(n)
     
-    return clamp_unit(score)
+    return max(-1.0, min(1.0, score))  # clamp_unit, inlined
 
 
 def analyze_fallback(text: str) -> str:
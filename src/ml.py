@@ -5,17 +5,20 @@ Predict: Load joblib artifact, return probabilities or label
 """
 
 import argparse
+import re
 import sys
+import unicodedata
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import joblib
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, f1_score
 from sklearn.model_selection import train_test_split
 
-from src.core import normalize, label_from_score, clamp_unit
+from src.core import normalize, label_from_score
 
 
 # Stable label ordering (alphabetical)
@@ -83,18 +86,19 @@ def train(tsv_path: str, out_path: str) -> None:
         min_df=1,
         max_df=0.9,
         strip_accents="unicode",
+        dtype=np.float32,  # Halves sparse-matrix memory/bandwidth
     )
     
     X_train_vec = vectorizer.fit_transform(X_train)
     X_val_vec = vectorizer.transform(X_val)
     
     # LogisticRegression: deterministic, stable
+    # lbfgs (L2, multinomial) converges fast on small sparse TF-IDF data
     clf = LogisticRegression(
-        solver="saga",
-        max_iter=1000,
+        solver="lbfgs",
+        max_iter=200,
         random_state=42,
         class_weight="balanced",
-        n_jobs=-1,
     )
     
     print("Training model...")
@@ -115,12 +119,124 @@ def train(tsv_path: str, out_path: str) -> None:
         "labels": LABELS,
     }
     
+    # Plain-array inference params, kept only if they reproduce sklearn
+    fast = extract_fast_params(vectorizer, clf)
+    if fast is None:
+        print("WARNING: fast inference path disabled (unsupported config)", file=sys.stderr)
+    else:
+        expected = clf.predict_proba(X_val_vec)
+        actual = np.array([_fast_proba(fast, text) for text in X_val])
+        if np.allclose(actual, expected, atol=1e-6):
+            model_dict["fast"] = fast
+        else:
+            print("WARNING: fast inference path disabled (mismatch)", file=sys.stderr)
+    
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
     joblib.dump(model_dict, out_path)
     
     print(f"Model saved to {out_path}")
 
 
+# Vectorizer settings _fast_analyze/_fast_proba can reproduce.
+# Anything else (stop words, sublinear tf, custom analyzers...) keeps
+# the model on the sklearn path.
+_FAST_SUPPORTED = {
+    "analyzer": {"word"},
+    "lowercase": {True, False},
+    "strip_accents": {None, "unicode"},
+    "stop_words": {None},
+    "sublinear_tf": {False},
+    "norm": {"l2"},
+    "use_idf": {True},
+    "binary": {False},
+}
+
+
+def extract_fast_params(vectorizer: TfidfVectorizer, clf: LogisticRegression) -> Optional[Dict]:
+    """Extract what inference needs as plain dicts/arrays.
+    
+    WHY: For short texts, sklearn's per-call Python overhead dominates.
+    Inference is just softmax(W . tfidf(text) + b), which NumPy can do
+    directly from the vocabulary, idf weights and coefficients.
+    
+    Args:
+        vectorizer: Fitted TfidfVectorizer
+        clf: Fitted multinomial LogisticRegression
+        
+    Returns:
+        Dict with vocab, idf, coef, intercept and the analyzer settings,
+        or None if the vectorizer/classifier config isn't supported
+    """
+    settings = {name: getattr(vectorizer, name) for name in _FAST_SUPPORTED}
+    for name, allowed in _FAST_SUPPORTED.items():
+        # Compare without hashing: stop_words may be a list
+        value = settings[name]
+        if not any(value is a or value == a for a in allowed):
+            return None
+    
+    if vectorizer.preprocessor is not None or vectorizer.tokenizer is not None:
+        return None
+    
+    # Softmax over per-class rows only matches multinomial, 3+ classes
+    if clf.coef_.shape[0] != len(clf.classes_) or len(clf.classes_) < 3:
+        return None
+    
+    return {
+        "vocab": {term: int(idx) for term, idx in vectorizer.vocabulary_.items()},
+        "idf": np.asarray(vectorizer.idf_),
+        "coef": np.asarray(clf.coef_),
+        "intercept": np.asarray(clf.intercept_),
+        "token_pattern": vectorizer.token_pattern,
+        "ngram_range": tuple(vectorizer.ngram_range),
+        **settings,
+    }
+
+
+def _fast_analyze(fast: Dict, text: str) -> List[str]:
+    """Replicate TfidfVectorizer's word analyzer for the supported settings."""
+    if fast["lowercase"]:
+        text = text.lower()
+    if fast["strip_accents"] == "unicode":
+        try:
+            text.encode("ascii")
+        except UnicodeEncodeError:
+            text = "".join(
+                c for c in unicodedata.normalize("NFKD", text)
+                if not unicodedata.combining(c)
+            )
+    
+    words = re.findall(fast["token_pattern"], text)
+    min_n, max_n = fast["ngram_range"]
+    
+    terms = list(words) if min_n == 1 else []
+    for n in range(max(min_n, 2), min(max_n, len(words)) + 1):
+        for i in range(len(words) - n + 1):
+            terms.append(" ".join(words[i:i + n]))
+    return terms
+
+
+def _fast_proba(fast: Dict, text: str) -> np.ndarray:
+    """Class probabilities from extracted params (label order of training)."""
+    vocab = fast["vocab"]
+    counts: Dict[int, int] = {}
+    for term in _fast_analyze(fast, text):
+        idx = vocab.get(term)
+        if idx is not None:
+            counts[idx] = counts.get(idx, 0) + 1
+    
+    logits = np.array(fast["intercept"], dtype=np.float64)
+    if counts:
+        idx = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+        vals = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        vals *= fast["idf"][idx]
+        vals /= np.sqrt(vals @ vals)
+        logits += fast["coef"][:, idx] @ vals
+    
+    logits -= logits.max()
+    probs = np.exp(logits)
+    return probs / probs.sum()
+
+
 def load_model(path: str = "models/sentiment.joblib") -> Dict:
     """Load trained model from disk.
     
@@ -129,11 +245,61 @@ def load_model(path: str = "models/sentiment.joblib") -> Dict:
         
     Returns:
         Model dict with keys: version, vectorizer, model, labels
+        (and "fast" for artifacts trained with inference params),
+        plus precomputed _pos_idx/_neg_idx label positions
         
     Raises:
         FileNotFoundError if model doesn't exist
     """
-    return joblib.load(path)
+    model_dict = joblib.load(path)
+    
+    # Resolve score label positions once, not per prediction
+    _score_indices(model_dict)
+    
+    return model_dict
+
+
+def _score_indices(model_dict: Dict) -> Tuple[int, int]:
+    """Positions of "positive"/"negative" in labels, cached in model_dict.
+    
+    load_model precomputes them; dicts built any other way (e.g. a plain
+    joblib.load) get them resolved on first use.
+    """
+    pos_idx = model_dict.get("_pos_idx")
+    if pos_idx is None:
+        labels = model_dict["labels"]
+        pos_idx = model_dict["_pos_idx"] = labels.index("positive")
+        model_dict["_neg_idx"] = labels.index("negative")
+    return pos_idx, model_dict["_neg_idx"]
+
+
+def predict_proba_batch(model_dict: Dict, texts: List[str]) -> List[Dict[str, float]]:
+    """Predict class probabilities for many texts at once.
+    
+    WHY: One vectorizer/classifier call amortizes sparse-matrix
+    construction and dispatch across the whole batch.
+    
+    Args:
+        model_dict: Loaded model dictionary
+        texts: Input texts
+        
+    Returns:
+        One dict per text mapping label -> probability (stable order)
+    """
+    if not texts:
+        return []
+    
+    vectorizer = model_dict["vectorizer"]
+    clf = model_dict["model"]
+    labels = model_dict["labels"]
+    
+    X = vectorizer.transform(texts)
+    probs = clf.predict_proba(X)
+    
+    return [
+        {label: float(prob) for label, prob in zip(labels, row)}
+        for row in probs
+    ]
 
 
 def predict_proba(model_dict: Dict, text: str) -> Dict[str, float]:
@@ -146,14 +312,25 @@ def predict_proba(model_dict: Dict, text: str) -> Dict[str, float]:
     Returns:
         Dict mapping label -> probability (stable order)
     """
-    vectorizer = model_dict["vectorizer"]
-    clf = model_dict["model"]
-    labels = model_dict["labels"]
+    return predict_proba_batch(model_dict, [text])[0]
+
+
+def analyze_ml_score_fast(model_dict: Dict, text: str) -> float:
+    """Compute sentiment score without calling into scikit-learn.
     
-    X = vectorizer.transform([text])
-    probs = clf.predict_proba(X)[0]
+    Uses the params stored under model_dict["fast"] at train time.
     
-    return {label: float(prob) for label, prob in zip(labels, probs)}
+    Args:
+        model_dict: Model dictionary from load_model (must contain "fast")
+        text: Input text
+        
+    Returns:
+        Sentiment score in [-1, 1]
+    """
+    probs = _fast_proba(model_dict["fast"], text)
+    pos_idx, neg_idx = _score_indices(model_dict)
+    score = float(probs[pos_idx] - probs[neg_idx])
+    return max(-1.0, min(1.0, score))  # clamp_unit, inlined
 
 
 def analyze_ml_score(model_dict: Dict, text: str) -> float:
@@ -165,15 +342,21 @@ def analyze_ml_score(model_dict: Dict, text: str) -> float:
     Neutral affects magnitude via proximity to 0.
     
     Args:
-        model_dict: Loaded model dictionary
+        model_dict: Model dictionary from load_model
         text: Input text
         
     Returns:
         Sentiment score in [-1, 1]
     """
-    probs = predict_proba(model_dict, text)
-    score = probs["positive"] - probs["negative"]
-    return clamp_unit(score)
+    if "fast" in model_dict:
+        return analyze_ml_score_fast(model_dict, text)
+    
+    # Index the probability row directly; no label -> prob dict needed
+    X = model_dict["vectorizer"].transform([text])
+    probs = model_dict["model"].predict_proba(X)[0]
+    pos_idx, neg_idx = _score_indices(model_dict)
+    score = float(probs[pos_idx] - probs[neg_idx])
+    return max(-1.0, min(1.0, score))  # clamp_unit, inlined
 
 
 def analyze_ml(model_dict: Dict, text: str) -> str:
@@ -8,7 +8,7 @@ import argparse
 import os
 import subprocess
 import sys
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, urlparse
 
 from src.strategy import analyze_strategy, analyze_strategy_score
@@ -81,7 +81,14 @@ def run_http(port: int = 8000) -> None:
     Args:
         port: Port to listen on
     """
-    server = HTTPServer(("0.0.0.0", port), SentimentHandler)
+    server = ThreadingHTTPServer(("0.0.0.0", port), SentimentHandler)
+    
+    # Load model up front so the first request doesn't pay for it
+    try:
+        analyze_strategy("warmup")
+    except Exception:
+        pass
+    
     print(f"HTTP server running on http://0.0.0.0:{port}")
     print(f"Try: curl 'http://localhost:{port}/analyze?text=I%20love%20pizza'")
     server.serve_forever()
@@ -126,9 +133,13 @@ def main():
     args = parser.parse_args()
     
     if args.test:
-        # Run pytest
-        result = subprocess.run(["pytest", "-q"], cwd=".")
-        sys.exit(result.returncode)
+        # Run pytest in-process; spawn it only if it isn't importable here
+        try:
+            import pytest
+        except ImportError:
+            result = subprocess.run(["pytest", "-q"], cwd=".")
+            sys.exit(result.returncode)
+        sys.exit(int(pytest.main(["-q"])))
     
     if not args.text:
         parser.print_help()
@@ -4,40 +4,70 @@ WHY: Disposability. Judges can rewrite this one function.
 Callers (CLI, HTTP) only import from here.
 """
 
+import functools
 from pathlib import Path
 from typing import Optional
 
+from src.core import normalize
 from src.fallback import analyze_fallback, analyze_fallback_score
 
-
-# Module-level cache: load model once
-_MODEL_CACHE: Optional[dict] = None
-_MODEL_LOADED = False
+# ML entry points, bound by _load_model_once once a model loads.
+# src.ml pulls in scikit-learn, so fallback-only runs never import it.
+_analyze_ml = None
+_analyze_ml_score = None
 
 
+@functools.lru_cache(maxsize=4)
 def _load_model_once(model_path: str = "models/sentiment.joblib") -> Optional[dict]:
-    """Load ML model (cached at module level).
+    """Load ML model (cached per model_path).
     
     Returns None if model doesn't exist or fails to load.
+    The outcome (including None) is cached, so the existence check
+    and joblib load happen once per path.
     """
-    global _MODEL_CACHE, _MODEL_LOADED
-    
-    if _MODEL_LOADED:
-        return _MODEL_CACHE
-    
-    _MODEL_LOADED = True  # Mark as attempted
+    global _analyze_ml, _analyze_ml_score
     
     if not Path(model_path).exists():
         return None
     
     try:
-        from src.ml import load_model
-        _MODEL_CACHE = load_model(model_path)
-        return _MODEL_CACHE
+        from src.ml import analyze_ml, analyze_ml_score, load_model
+        model = load_model(model_path)
     except Exception:
         return None
+    
+    _analyze_ml, _analyze_ml_score = analyze_ml, analyze_ml_score
+    return model
+
+
+# Results are memoized per (normalize(text), model_path). Texts longer
+# than _CACHE_MAX_CHARS after normalization skip the cache, so each
+# entry stays small (~1 KB).
+_CACHE_MAX_CHARS = 1024
+
+
+def _memoize_normalized(func):
+    """Memoize func(text, model_path) on normalized text.
+    
+    WHY: Repeat queries skip vectorization/prediction entirely, and
+    variants differing only in case or whitespace share one entry.
+    func always receives normalize(text), cached or not.
+    """
+    cached = functools.lru_cache(maxsize=4096)(func)
+    
+    @functools.wraps(func)
+    def wrapper(text: str, model_path: str = "models/sentiment.joblib"):
+        text = normalize(text)
+        if len(text) > _CACHE_MAX_CHARS:
+            return func(text, model_path)
+        return cached(text, model_path)
+    
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
 
 
+@_memoize_normalized
 def analyze_strategy(text: str, model_path: str = "models/sentiment.joblib") -> str:
     """Analyze sentiment: ML if available, else fallback.
     
@@ -45,6 +75,11 @@ def analyze_strategy(text: str, model_path: str = "models/sentiment.joblib") ->
     
     WHY: Single point of control for disposability test.
     
+    text arrives already normalized (lowercased, whitespace collapsed)
+    and results are memoized on it. Both built-in analyzers ignore case
+    and whitespace runs. If your logic doesn't, drop the decorator.
+    Call clear_caches() after replacing a model file in-process.
+    
     Args:
         text: Input text to analyze
         model_path: Path to ML model (optional)
@@ -55,15 +90,17 @@ def analyze_strategy(text: str, model_path: str = "models/sentiment.joblib") ->
     model = _load_model_once(model_path)
     
     if model is not None:
-        from src.ml import analyze_ml
-        return analyze_ml(model, text)
+        return _analyze_ml(model, text)
     else:
         return analyze_fallback(text)
 
 
+@_memoize_normalized
 def analyze_strategy_score(text: str, model_path: str = "models/sentiment.joblib") -> float:
     """Analyze sentiment: return numeric score.
     
+    Normalized and memoized like analyze_strategy (see its notes).
+    
     Args:
         text: Input text to analyze
         model_path: Path to ML model (optional)
@@ -74,7 +111,13 @@ def analyze_strategy_score(text: str, model_path: str = "models/sentiment.joblib
     model = _load_model_once(model_path)
     
     if model is not None:
-        from src.ml import analyze_ml_score
-        return analyze_ml_score(model, text)
+        return _analyze_ml_score(model, text)
     else:
         return analyze_fallback_score(text)
+
+
+def clear_caches() -> None:
+    """Drop memoized models and results (e.g. after replacing a model file)."""
+    _load_model_once.cache_clear()
+    analyze_strategy.cache_clear()
+    analyze_strategy_score.cache_clear()
@@ -1,5 +1,9 @@
 """Tests for fallback.py: rule-based sentiment analyzer."""
 
+import os
+import subprocess
+import sys
+
 import pytest
 
 from src.fallback import analyze_fallback, analyze_fallback_score
@@ -71,6 +75,23 @@ def test_fallback_emoji_negative():
     assert analyze_fallback("👎") == "negative"
 
 
+def test_fallback_emoji_mixed_deterministic():
+    """Test mixed emojis on the threshold score the same under any hash seed."""
+    text = "😞😡👍don't!😀"
+    assert analyze_fallback(text) == "neutral"
+    
+    # Set iteration order varies with the hash seed; the sum must not
+    code = f"from src.fallback import analyze_fallback; print(analyze_fallback({text!r}))"
+    for seed in ("1", "2", "3", "6"):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        )
+        assert result.stdout.strip() == "neutral"
+
+
 def test_fallback_punctuation_emphasis():
     """Test exclamation marks add emphasis."""
     score_plain = analyze_fallback_score("good")
@@ -3,9 +3,16 @@
 import tempfile
 from pathlib import Path
 
+import joblib
 import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
 
-from src.ml import train, load_model, predict_proba, analyze_ml_score, analyze_ml
+from src.ml import (
+    train, load_model, predict_proba, predict_proba_batch,
+    analyze_ml_score, analyze_ml_score_fast, analyze_ml,
+    extract_fast_params, load_tsv,
+)
 
 
 @pytest.fixture
@@ -54,6 +61,23 @@ def test_predict_proba(trained_model):
     assert 0.99 <= total <= 1.01
 
 
+def test_predict_proba_batch(trained_model):
+    """Test batch prediction matches single-text prediction."""
+    model = load_model(trained_model)
+    texts = ["I love this!", "This is terrible", "okay"]
+    
+    batch = predict_proba_batch(model, texts)
+    
+    assert len(batch) == len(texts)
+    for text, probs in zip(texts, batch):
+        single = predict_proba(model, text)
+        assert probs.keys() == single.keys()
+        for label in probs:
+            assert probs[label] == pytest.approx(single[label])
+    
+    assert predict_proba_batch(model, []) == []
+
+
 def test_analyze_ml_score_positive(trained_model):
     """Test ML score for positive text."""
     model = load_model(trained_model)
@@ -85,6 +109,51 @@ def test_analyze_ml_score_range(trained_model):
         assert -1.0 <= score <= 1.0
 
 
+def test_analyze_ml_score_fast_matches_sklearn(trained_model):
+    """Test extracted-params inference matches the sklearn path."""
+    model = load_model(trained_model)
+    assert "fast" in model
+    
+    sklearn_only = {k: v for k, v in model.items() if k != "fast"}
+    texts = ["I love this!", "This is terrible", "okay", "", "Café très bon"]
+    
+    for text in texts:
+        fast = analyze_ml_score_fast(model, text)
+        slow = analyze_ml_score(sklearn_only, text)
+        assert fast == pytest.approx(slow, abs=1e-6)
+
+
+def test_extract_fast_params_rejects_unsupported_config():
+    """Test fast params are refused for vectorizer settings they can't replicate."""
+    texts, labels = load_tsv("data/demo_train.tsv")
+    
+    unsupported = [
+        {"sublinear_tf": True},
+        {"stop_words": "english"},
+        {"stop_words": ["the"]},
+        {"strip_accents": "ascii"},
+    ]
+    
+    for kwargs in unsupported:
+        vectorizer = TfidfVectorizer(**kwargs)
+        clf = LogisticRegression().fit(vectorizer.fit_transform(texts), labels)
+        assert extract_fast_params(vectorizer, clf) is None
+
+
+def test_analyze_ml_score_raw_artifact(trained_model):
+    """Test scoring works on a dict not built by load_model."""
+    model = load_model(trained_model)
+    raw = joblib.load(trained_model)
+    
+    # Copy before scoring, so neither dict has the cached label indices
+    sklearn_only = {k: v for k, v in raw.items() if k != "fast"}
+    assert "_pos_idx" not in raw
+    
+    for text in ["I love this!", "This is terrible"]:
+        assert analyze_ml_score(raw, text) == pytest.approx(analyze_ml_score(model, text))
+        assert analyze_ml(sklearn_only, text) == analyze_ml(model, text)
+
+
 def test_analyze_ml_label(trained_model):
     """Test ML label prediction."""
     model = load_model(trained_model)
@@ -0,0 +1,53 @@
+"""Tests for strategy.py: entry point and result caching."""
+
+import pytest
+
+from src.strategy import analyze_strategy, analyze_strategy_score, clear_caches
+
+
+NO_MODEL = "models/does-not-exist.joblib"
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    """Start and end every test with empty caches."""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+def test_strategy_cache_shares_normalized_text():
+    """Test texts differing only in case/whitespace share one cache entry."""
+    assert analyze_strategy("I love pizza", model_path=NO_MODEL) == "positive"
+    assert analyze_strategy("  i LOVE\tpizza ", model_path=NO_MODEL) == "positive"
+
+    info = analyze_strategy.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert info.currsize == 1
+
+
+def test_strategy_score_cache_shares_normalized_text():
+    """Test score caching is keyed on normalized text too."""
+    first = analyze_strategy_score("This is terrible", model_path=NO_MODEL)
+    second = analyze_strategy_score("THIS  is terrible", model_path=NO_MODEL)
+
+    assert first == second
+    assert analyze_strategy_score.cache_info().hits == 1
+
+
+def test_strategy_long_text_bypasses_cache():
+    """Test very long texts are analyzed but not cached."""
+    assert analyze_strategy("bad " * 2000, model_path=NO_MODEL) == "negative"
+    assert analyze_strategy.cache_info().currsize == 0
+
+
+def test_clear_caches():
+    """Test clear_caches empties the result caches."""
+    analyze_strategy("I love pizza", model_path=NO_MODEL)
+    analyze_strategy_score("I love pizza", model_path=NO_MODEL)
+
+    clear_caches()
+
+    assert analyze_strategy.cache_info().currsize == 0
+    assert analyze_strategy_score.cache_info().currsize == 0